@@ -0,0 +1,17 @@
+"""
+Interactive Portfolio Terminal - gunicorn configuration
+Loaded automatically by `gunicorn wsgi:app` from the project directory.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# One process per core, each serving requests from a small thread pool
+workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+worker_class = 'gthread'
+threads = 8
+
+# Keep client connections open between the terminal's back-to-back POSTs
+keepalive = 30
+timeout = 30
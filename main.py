@@ -4,12 +4,21 @@ Interactive Portfolio Terminal - Flask Backend
 A secure web terminal that executes both portfolio commands and system commands through a Flask API.
 """
 
+import functools
+import heapq
+import orjson
 import subprocess
 import re
+import platform
 import psutil
+import pwd
+import grp
 import shlex
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request
 from flask_cors import CORS
 import os
 
@@ -19,6 +28,14 @@ app.secret_key = os.environ.get('SESSION_SECRET', 'default-dev-key')
 # Security: Restrict CORS to localhost only in development
 CORS(app, origins=['http://localhost:5000', 'http://127.0.0.1:5000'])
 
+
+def ojsonify(obj, status=200):
+    """Serialize obj with orjson into a JSON response."""
+    return Response(orjson.dumps(obj),
+                    status=status,
+                    mimetype='application/json')
+
+
 # Portfolio data dictionary with personal information
 portfolio_data = {
     "about":
@@ -78,6 +95,24 @@ NextGenAI - Technical Club Head
 - Demonstrated 22% metric improvement in document embedding tasks vs baselines"""
 }
 
+# Finished output text for each static portfolio command
+PORTFOLIO_OUTPUTS = {
+    'about': portfolio_data['about'],
+    'resume': f"📄 My Resume: {portfolio_data['resume']}",
+    'skills': f"💻 Technical Skills:\n{portfolio_data['skills']}",
+    'projects': portfolio_data['projects'],
+    'contact': portfolio_data['contact'],
+    'education': portfolio_data['education'],
+    'experience': portfolio_data['experience'],
+    'achievements': portfolio_data['achievements'],
+}
+
+# Portfolio data never changes at runtime, so serialize the JSON bodies once
+PORTFOLIO_RESPONSES = {
+    name: orjson.dumps({'output': text, 'status': 0})
+    for name, text in PORTFOLIO_OUTPUTS.items()
+}
+
 # Security: Allowlist of safe commands that can be executed
 # This is much safer than a blacklist approach
 SAFE_COMMANDS = {
@@ -146,17 +181,88 @@ SAFE_READ_PATHS = [
     '/proc/meminfo', '/proc/version', '/proc/uptime', '/proc/loadavg'
 ]
 
+# Allowlisted flags per command: a frozenset for exact matches and a tuple
+# for str.startswith prefix matches (e.g. `-n5` matches `-n`)
+_SAFE_FLAGS = {cmd: frozenset(flags) for cmd, flags in SAFE_COMMANDS.items()}
+_SAFE_PREFIXES = {cmd: tuple(flags) for cmd, flags in SAFE_COMMANDS.items()}
+
+# Limits for system command execution
+MAX_COMMAND_LENGTH = 4096  # characters, before any parsing or caching
+COMMAND_TIMEOUT = 15  # seconds
+OUTPUT_CHUNK_SIZE = 65536
+MAX_OUTPUT_BYTES = 1024 * 1024
+
+# Rendered terminal page; the template is static, so it is rendered once
+_index_html = None
+
+# Maximum number of commands accepted by one /run_commands request
+MAX_BATCH_COMMANDS = 16
+
+# Subprocess pool shared by every concurrent batch; commands are mostly
+# waiting on child processes, so it is sized above the core count. Work
+# queued behind other batches still honours each batch's deadline
+_batch_executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
+
+# Working directory and environment for system commands, built once at
+# startup since neither changes at runtime
+_CWD = os.getcwd()
+# Additional security: limit PATH for executed commands
+_SAFE_ENV = {**os.environ, 'PATH': '/usr/bin:/bin'}
+
+# Shell metacharacters, globs, quotes and whitespace control characters
+# that are never allowed inside an argument; rejecting backslash and
+# newline also rules out line continuations
+_DANGEROUS_RE = re.compile(r'[;&|`$(){}\\<>*?\[\]\n\r\t\'"]')
+
+# Short flags accepted even when not explicitly listed in SAFE_COMMANDS
+_FLAG_RE = re.compile(r'^-[a-zA-Z0-9]+$')
+
+# Seconds between background system information samples
+SYSINFO_SAMPLE_INTERVAL = 2
+
+# Latest formatted sysinfo output; replaced atomically by the sampler thread
+_sysinfo_snapshot = None
+
+# Pid of the process whose sampler thread is running; started lazily
+_sysinfo_sampler_pid = None
+_sysinfo_sampler_lock = threading.Lock()
+
 
 def is_command_safe(command):
     """
     Check if a command is safe to execute using an allowlist approach.
-    Returns (is_safe: bool, safe_args: list) or (False, None) if unsafe.
+    Expects an already stripped command string.
+    Returns (is_safe: bool, safe_args: tuple) or (False, None) if unsafe.
+
+    >>> is_command_safe('ls -la')
+    (True, ('ls', '-la'))
+    >>> is_command_safe('find . -name *.py')  # globs are rejected
+    (False, None)
+    >>> is_command_safe('grep -i "model name" /proc/cpuinfo')
+    (True, ('grep', '-i', 'model name', '/proc/cpuinfo'))
+    >>> is_command_safe('ls "a;b"')  # quoting doesn't hide metacharacters
+    (False, None)
+    >>> is_command_safe("ls 'unterminated")
+    (False, None)
+    >>> is_command_safe('ls\\x0b-la')  # same tokens as shlex: one word
+    (False, None)
     """
+    # Multi-line input could smuggle a second command or a line continuation
+    if '\n' in command or '\r' in command:
+        return False, None
+
     try:
-        # Parse command using shlex to handle quotes and escaping properly
-        parts = shlex.split(command.strip())
+        # Plain commands split on spaces; fall back to shlex to handle
+        # quotes and escaping properly. isprintable() rules out tabs and
+        # other Unicode whitespace, which str.split() would treat as
+        # separators but shlex does not
+        if (command.isprintable() and '"' not in command
+                and "'" not in command and '\\' not in command):
+            parts = [part for part in command.split(' ') if part]
+        else:
+            parts = shlex.split(command)
         if not parts:
-            return True, []
+            return True, ()
 
         base_command = parts[0]
         args = parts[1:] if len(parts) > 1 else []
@@ -165,7 +271,8 @@ def is_command_safe(command):
         if base_command not in SAFE_COMMANDS:
             return False, None
 
-        allowed_flags = SAFE_COMMANDS[base_command]
+        allowed_flags = _SAFE_FLAGS[base_command]
+        allowed_prefixes = _SAFE_PREFIXES[base_command]
 
         # Validate arguments
         safe_args = [base_command]
@@ -173,90 +280,234 @@ def is_command_safe(command):
         while i < len(args):
             arg = args[i]
 
-            # Allow literal values (no dangerous characters)
-            if not re.search(r'[;&|`$(){}\\]', arg):
-                # For commands like cat, check if file path is safe
-                if base_command == 'cat':
-                    if arg.startswith('/') and arg not in SAFE_READ_PATHS:
-                        return False, None
-                    if '..' in arg or arg.startswith('~'):
+            # Reject dangerous characters before any other processing
+            if _DANGEROUS_RE.search(arg):
+                return False, None
+
+            # For commands like cat, check if file path is safe
+            if base_command == 'cat':
+                if arg.startswith('/') and arg not in SAFE_READ_PATHS:
+                    return False, None
+                if '..' in arg or arg.startswith('~'):
+                    return False, None
+
+            # For flags, check if they're allowed
+            if arg.startswith('-'):
+                if (arg not in allowed_flags
+                        and not arg.startswith(allowed_prefixes)):
+                    # Allow some common safe flags not explicitly listed
+                    if not _FLAG_RE.match(arg):
                         return False, None
 
-                # For flags, check if they're allowed
-                if arg.startswith('-'):
-                    if arg not in allowed_flags and not any(
-                            arg.startswith(flag) for flag in allowed_flags):
-                        # Allow some common safe flags not explicitly listed
-                        if not re.match(r'^-[a-zA-Z0-9]+$', arg):
-                            return False, None
+            safe_args.append(arg)
+            i += 1
 
-                safe_args.append(arg)
-                i += 1
-            else:
-                return False, None
-
-        return True, safe_args
+        return True, tuple(safe_args)
 
     except (ValueError, TypeError):
         # shlex.split failed - command has unsafe characters
         return False, None
 
 
-def handle_portfolio_command(command):
-    """
-    Handle portfolio-specific commands.
-    Returns (is_portfolio_cmd: bool, output: str) tuple.
-    """
-    command_lower = command.lower().strip()
+def _user_name(uid):
+    """Resolve a user id to its name, falling back to the numeric id."""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
 
-    # Portfolio commands
-    if command_lower == 'about':
-        return True, portfolio_data['about']
+def _group_name(gid):
+    """Resolve a group id to its name, falling back to the numeric id."""
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+def _human_size(num_bytes, suffix=''):
+    """Format a byte count the way coreutils' -h flag does (e.g. 5.9G)."""
+    for unit in ('B', 'K', 'M', 'G', 'T'):
+        if num_bytes < 1024 or unit == 'T':
+            if unit == 'B':
+                return f"{num_bytes}B"
+            precision = 1 if num_bytes < 10 else 0
+            return f"{num_bytes:.{precision}f}{unit}{suffix}"
+        num_bytes /= 1024
+
+
+def _builtin_id():
+    """Python equivalent of `id`."""
+    uid, gid = os.getuid(), os.getgid()
+    group_ids = [gid] + [g for g in os.getgroups() if g != gid]
+    groups = ','.join(f"{g}({_group_name(g)})" for g in group_ids)
+    return (f"uid={uid}({_user_name(uid)}) gid={gid}({_group_name(gid)}) "
+            f"groups={groups}")
+
+
+def _builtin_uname_all():
+    """Python equivalent of `uname -a`."""
+    uname = platform.uname()
+    return ' '.join(field for field in (uname.system, uname.node,
+                                        uname.release, uname.version,
+                                        uname.machine) if field)
+
+
+def _builtin_uptime():
+    """Python equivalent of `uptime`."""
+    seconds = int(datetime.now().timestamp() - psutil.boot_time())
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes = seconds // 60
+
+    up = f"{days} day{'s' if days != 1 else ''}, " if days else ""
+    up += f"{hours:2d}:{minutes:02d}" if hours else f"{minutes} min"
+    users = len(psutil.users())
+    load1, load5, load15 = os.getloadavg()
+    return (f" {datetime.now():%H:%M:%S} up {up},  "
+            f"{users} user{'s' if users != 1 else ''},  "
+            f"load average: {load1:.2f}, {load5:.2f}, {load15:.2f}")
+
+
+def _builtin_free(human=False):
+    """Python equivalent of `free` / `free -h`."""
+    memory = psutil.virtual_memory()
+    swap = psutil.swap_memory()
+
+    def size(num_bytes):
+        return _human_size(num_bytes, 'i') if human else str(num_bytes // 1024)
+
+    shared = getattr(memory, 'shared', 0)
+    buff_cache = getattr(memory, 'buffers', 0) + getattr(memory, 'cached', 0)
+    columns = ('total', 'used', 'free', 'shared', 'buff/cache', 'available')
+    lines = [f"{'':<7}" + ''.join(f"{col:>12}" for col in columns)]
+    lines.append(f"{'Mem:':<7}" + ''.join(
+        f"{size(value):>12}"
+        for value in (memory.total, memory.used, memory.free, shared,
+                      buff_cache, memory.available)))
+    lines.append(f"{'Swap:':<7}" + ''.join(
+        f"{size(value):>12}" for value in (swap.total, swap.used, swap.free)))
+    return '\n'.join(lines)
+
+
+def _builtin_df(human=False):
+    """Python equivalent of `df` / `df -h`."""
+
+    def size(num_bytes):
+        return _human_size(num_bytes) if human else str(num_bytes // 1024)
+
+    size_header = 'Size' if human else '1K-blocks'
+    avail_header = 'Avail' if human else 'Available'
+    lines = [
+        f"{'Filesystem':<20} {size_header:>10} {'Used':>10} "
+        f"{avail_header:>10} {'Use%':>5} Mounted on"
+    ]
+    for partition in psutil.disk_partitions():
+        try:
+            usage = psutil.disk_usage(partition.mountpoint)
+        except OSError:
+            continue
+        lines.append(f"{partition.device:<20} {size(usage.total):>10} "
+                     f"{size(usage.used):>10} {size(usage.free):>10} "
+                     f"{usage.percent:>4.0f}% {partition.mountpoint}")
+    return '\n'.join(lines)
 
-    elif command_lower == 'resume':
-        return True, f"📄 My Resume: {portfolio_data['resume']}"
 
-    elif command_lower == 'skills':
-        return True, f"💻 Technical Skills:\n{portfolio_data['skills']}"
+def _portfolio_date():
+    """Current date and time for the portfolio `date` command."""
+    current_time = datetime.now()
+    return current_time.strftime("📅 %A, %B %d, %Y\n🕒 %I:%M:%S %p")
 
-    elif command_lower == 'projects':
-        return True, portfolio_data['projects']
 
-    elif command_lower == 'contact':
-        return True, portfolio_data['contact']
+# Dynamic portfolio commands; static ones are served from PORTFOLIO_OUTPUTS
+PORTFOLIO_DISPATCH = {
+    'date': _portfolio_date,
+    'echo': lambda: "",  # Empty echo
+}
 
-    elif command_lower == 'education':
-        return True, portfolio_data['education']
+# Common system commands answered in-process instead of forking a child.
+# Any other invocation of these commands still goes through the allowlist.
+SYSTEM_BUILTINS = {
+    'whoami': lambda: _user_name(os.geteuid()),
+    'pwd': lambda: _CWD,
+    'id': _builtin_id,
+    'uname': lambda: platform.system(),
+    'uname -s': lambda: platform.system(),
+    'uname -r': lambda: platform.release(),
+    'uname -a': _builtin_uname_all,
+    'uptime': _builtin_uptime,
+    'free': _builtin_free,
+    'free -h': lambda: _builtin_free(human=True),
+    'df': _builtin_df,
+    'df -h': lambda: _builtin_df(human=True),
+}
 
-    elif command_lower == 'experience':
-        return True, portfolio_data['experience']
 
-    elif command_lower == 'achievements':
-        return True, portfolio_data['achievements']
+# The command handlers below take `command`, the stripped user input, and
+# `command_lower`, its lowercased form; both are computed once per command
+# by the request handlers.
 
-    elif command_lower == 'date':
-        current_time = datetime.now()
-        return True, current_time.strftime("📅 %A, %B %d, %Y\n🕒 %I:%M:%S %p")
 
-    elif command_lower.startswith('echo '):
-        echo_text = command[5:]  # Remove 'echo ' prefix
-        return True, echo_text if echo_text.strip() else ""
+def _classify_system_command(command):
+    """Classify a command for the allowlisted subprocess path."""
+    is_safe, safe_args = is_command_safe(command)
+    if not is_safe or safe_args is None:
+        return 'blocked', None
+    return 'system', safe_args
 
-    elif command_lower == 'echo':
-        return True, ""  # Empty echo
 
-    # Not a portfolio command
-    return False, ""
+@functools.lru_cache(maxsize=2048)
+def classify(command, command_lower):
+    """
+    Decide how a command is served, memoized per command string.
+    Returns (kind, payload) where kind is one of:
+      'portfolio' - payload is the constant output string
+      'builtin'   - payload is a handler returning the (dynamic) output
+      'sysinfo'   - payload is None
+      'system'    - payload is the tuple of allowlisted subprocess args
+      'blocked'   - payload is None
+    portfolio_data is immutable, so cached entries never go stale.
+    """
+    # Empty commands and static portfolio commands
+    if not command:
+        return 'portfolio', ''
+    if command_lower in PORTFOLIO_OUTPUTS:
+        return 'portfolio', PORTFOLIO_OUTPUTS[command_lower]
+
+    # Dynamic portfolio commands and system commands implemented in Python
+    handler = PORTFOLIO_DISPATCH.get(command_lower)
+    if handler is None:
+        handler = SYSTEM_BUILTINS.get(command)
+    if handler is not None:
+        return 'builtin', handler
+
+    # Handle special sysinfo command
+    if command_lower == 'sysinfo':
+        return 'sysinfo', None
+
+    # Security check using allowlist for system commands
+    return _classify_system_command(command)
+
+
+def _iter_process_info():
+    """Yield the pid/name/cpu/memory info dict of every live process."""
+    for proc in psutil.process_iter(
+        ['pid', 'name', 'cpu_percent', 'memory_percent']):
+        try:
+            yield proc.info
+        except (psutil.NoSuchProcess, psutil.AccessDenied,
+                psutil.ZombieProcess):
+            pass
 
 
-def get_system_info():
+def collect_system_info(cpu_interval=None):
     """
-    Get system information using psutil.
+    Collect system information using psutil.
     Returns formatted string with CPU, memory, and process information.
     """
     try:
         # CPU information
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=cpu_interval)
         cpu_count = psutil.cpu_count()
 
         # Memory information
@@ -271,20 +522,10 @@ def get_system_info():
         disk_total_gb = disk.total / (1024**3)
         disk_percent = (disk.used / disk.total) * 100
 
-        # Top 5 processes by CPU usage
-        processes = []
-        for proc in psutil.process_iter(
-            ['pid', 'name', 'cpu_percent', 'memory_percent']):
-            try:
-                processes.append(proc.info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied,
-                    psutil.ZombieProcess):
-                pass
-
-        # Sort by CPU usage and get top 5
-        processes = sorted(processes,
-                           key=lambda x: x['cpu_percent'] or 0,
-                           reverse=True)[:5]
+        # Top 5 processes by CPU usage, selected in one pass with a heap
+        processes = heapq.nlargest(5,
+                                   _iter_process_info(),
+                                   key=lambda x: x['cpu_percent'] or 0)
 
         # Format the output
         output = f"""
@@ -313,10 +554,226 @@ Top Processes (by CPU):
         return f"Error retrieving system information: {str(e)}"
 
 
+def _sysinfo_sampler():
+    """Refresh the cached system information snapshot forever."""
+    global _sysinfo_snapshot
+    while True:
+        started = time.monotonic()
+        _sysinfo_snapshot = collect_system_info(SYSINFO_SAMPLE_INTERVAL)
+        # cpu_percent() normally sleeps for the interval, but a failed
+        # sample returns at once; pace the loop so it can never spin
+        remaining = SYSINFO_SAMPLE_INTERVAL - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def _ensure_sysinfo_sampler():
+    """
+    Start the sampler thread on first use, once per process.
+    Tracks the pid so a forked child starts its own thread.
+    """
+    global _sysinfo_sampler_pid
+    if _sysinfo_sampler_pid == os.getpid():
+        return
+    with _sysinfo_sampler_lock:
+        if _sysinfo_sampler_pid != os.getpid():
+            threading.Thread(target=_sysinfo_sampler,
+                             name='sysinfo-sampler',
+                             daemon=True).start()
+            _sysinfo_sampler_pid = os.getpid()
+
+
+def get_system_info():
+    """
+    Return the latest system information snapshot without blocking.
+    Falls back to a non-blocking collection until the first sample lands.
+    """
+    _ensure_sysinfo_sampler()
+    snapshot = _sysinfo_snapshot
+    if snapshot is None:
+        return collect_system_info()
+    return snapshot
+
+
+def execute_command(safe_args):
+    """
+    Run an allowlisted command and read its combined output in chunks.
+    Returns (output: bytes, return_code: int); output is capped at
+    MAX_OUTPUT_BYTES. Raises subprocess.TimeoutExpired on timeout.
+    """
+    with subprocess.Popen(
+            safe_args,
+            shell=False,  # Much safer than shell=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # Combine stdout and stderr
+            bufsize=OUTPUT_CHUNK_SIZE,
+            cwd=_CWD,
+            env=_SAFE_ENV
+    ) as proc:
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(COMMAND_TIMEOUT, kill_on_timeout)
+        timer.start()
+        try:
+            chunks = []
+            remaining = MAX_OUTPUT_BYTES
+            truncated = stopped = False
+            for chunk in iter(lambda: proc.stdout.read(OUTPUT_CHUNK_SIZE),
+                              b''):
+                chunks.append(chunk[:remaining])
+                remaining -= len(chunk)
+                if remaining <= 0:
+                    # Stop reading and don't let the child block on a full pipe
+                    truncated = True
+                    stopped = proc.poll() is None
+                    if stopped:
+                        proc.kill()
+                    break
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(safe_args, COMMAND_TIMEOUT)
+
+    # Most outputs fit in a single read, so avoid copying them again
+    output = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+    if truncated:
+        # returncode stays the real status (non-zero if we killed it)
+        note = f"\n... output truncated at {MAX_OUTPUT_BYTES} bytes"
+        if stopped:
+            note += "; process stopped"
+        output += note.encode()
+    return output, returncode
+
+
+def resolve_user_command(command, command_lower):
+    """
+    Answer a command without running a subprocess where possible.
+    Returns (result: dict, http_status: int, None), or (None, None,
+    safe_args) when the command must run through execute_command.
+    """
+    # Bound the keys (and payloads) held by the classify cache
+    if len(command) > MAX_COMMAND_LENGTH:
+        return {
+            'output':
+            f'Error: Commands are limited to {MAX_COMMAND_LENGTH} characters',
+            'status': 1
+        }, 413, None
+
+    # echo output is the text itself; keep it out of the memoized classify
+    if command_lower.startswith('echo '):
+        echo_text = command[5:]  # Remove 'echo ' prefix
+        return {
+            'output': echo_text if echo_text.strip() else "",
+            'status': 0
+        }, 200, None
+
+    kind, payload = classify(command, command_lower)
+
+    if kind == 'portfolio':
+        return {'output': payload, 'status': 0}, 200, None
+
+    if kind == 'builtin':
+        try:
+            return {'output': payload(), 'status': 0}, 200, None
+        except (OSError, psutil.Error):
+            # Fall back to running the real command
+            kind, payload = _classify_system_command(command)
+
+    if kind == 'sysinfo':
+        return {'output': get_system_info(), 'status': 0}, 200, None
+
+    if kind == 'blocked':
+        return {
+            'output':
+            'Error: Command not allowed. Only safe read-only commands are permitted.',
+            'status': 1
+        }, 403, None
+
+    return None, None, payload
+
+
+def run_system_command(safe_args):
+    """
+    Execute allowlisted args as a subprocess.
+    Returns (result: dict, http_status: int) tuple.
+    """
+    # Execute the command using subprocess with shell=False for better security
+    try:
+        output, returncode = execute_command(safe_args)
+        # Decode exactly once, at the JSON boundary
+        return {
+            'output': output.decode('utf-8', errors='replace'),
+            'status': returncode
+        }, 200
+
+    except subprocess.TimeoutExpired:
+        return {
+            'output':
+            f'Error: Command timed out after {COMMAND_TIMEOUT} seconds',
+            'status': 1
+        }, 408
+
+    except Exception as e:
+        return {
+            'output': f'Error executing command: {str(e)}',
+            'status': 1
+        }, 500
+
+
+def run_user_command(command, command_lower):
+    """
+    Run a single user command through builtins, sysinfo and the allowlist.
+    Returns (result: dict, http_status: int) tuple.
+    """
+    result, http_status, safe_args = resolve_user_command(
+        command, command_lower)
+    if safe_args is None:
+        return result, http_status
+    return run_system_command(safe_args)
+
+
+def _run_batch_system_command(safe_args):
+    """Run one subprocess from a /run_commands batch, returning its result."""
+    result, _ = run_system_command(safe_args)
+    return result
+
+
 @app.route('/')
 def index():
     """Serve the main terminal interface."""
-    return render_template('index.html')
+    global _index_html
+    if _index_html is None:
+        # Render once, inside a real request so url_for() sees the mount point
+        _index_html = render_template('index.html').encode()
+    return Response(_index_html, mimetype='text/html')
+
+
+def parse_json_body():
+    """
+    Parse the request body with orjson.
+    Returns (data, None) or (None, error_response) for a bad request.
+    """
+    # Require application/json: a text/plain POST is a CORS "simple"
+    # request, so any site could send one without a preflight
+    if request.mimetype != 'application/json':
+        return None, ojsonify({
+            'output': 'Error: Content-Type must be application/json',
+            'status': 1
+        }, 415)
+
+    try:
+        return orjson.loads(request.get_data(cache=False)), None
+    except orjson.JSONDecodeError:
+        return None, ojsonify({
+            'output': 'Error: Invalid JSON body',
+            'status': 1
+        }, 400)
 
 
 @app.route('/run_command', methods=['POST'])
@@ -329,87 +786,110 @@ def run_command():
     """
     try:
         # Get command from JSON request
-        data = request.get_json()
-        if not data or 'command' not in data:
-            return jsonify({
+        data, error_response = parse_json_body()
+        if error_response is not None:
+            return error_response
+
+        if not isinstance(data, dict) or 'command' not in data:
+            return ojsonify({
                 'output': 'Error: No command provided',
                 'status': 1
-            }), 400
+            }, 400)
+
+        if not isinstance(data['command'], str):
+            return ojsonify({
+                'output': 'Error: Command must be a string',
+                'status': 1
+            }, 400)
 
+        # Normalize once; everything below works on these two forms
         command = data['command'].strip()
+        command_lower = command.lower()
 
-        # Handle empty commands
-        if not command:
-            return jsonify({'output': '', 'status': 0})
+        # Static portfolio commands are served from precomputed bytes
+        portfolio_response = PORTFOLIO_RESPONSES.get(command_lower)
+        if portfolio_response is not None:
+            return Response(portfolio_response, mimetype='application/json')
 
-        # First, check if it's a portfolio command
-        is_portfolio_cmd, portfolio_output = handle_portfolio_command(command)
-        if is_portfolio_cmd:
-            return jsonify({'output': portfolio_output, 'status': 0})
+        result, http_status = run_user_command(command, command_lower)
+        return ojsonify(result, http_status)
 
-        # Handle special sysinfo command
-        if command.lower() == 'sysinfo':
-            return jsonify({'output': get_system_info(), 'status': 0})
+    except Exception as e:
+        return ojsonify({'output': f'Server error: {str(e)}', 'status': 1}, 500)
 
-        # Security check using allowlist for system commands
-        is_safe, safe_args = is_command_safe(command)
-        if not is_safe or safe_args is None:
-            return jsonify({
-                'output':
-                'Error: Command not allowed. Only safe read-only commands are permitted.',
-                'status': 1
-            }), 403
 
-        # Execute the command using subprocess with shell=False for better security
-        try:
-            result = subprocess.run(
-                safe_args,
-                shell=False,  # Much safer than shell=True
-                capture_output=True,
-                text=True,
-                timeout=15,  # Reduced timeout
-                cwd=os.getcwd(),
-                # Additional security: limit resources
-                env=dict(os.environ, PATH='/usr/bin:/bin')  # Limit PATH
-            )
-
-            # Combine stdout and stderr
-            output = ""
-            if result.stdout:
-                output += result.stdout
-            if result.stderr:
-                if output:
-                    output += "\n"
-                output += result.stderr
-
-            return jsonify({'output': output, 'status': result.returncode})
-
-        except subprocess.TimeoutExpired:
-            return jsonify({
-                'output': 'Error: Command timed out after 30 seconds',
+@app.route('/run_commands', methods=['POST'])
+def run_commands():
+    """
+    Execute a batch of commands concurrently and return all results.
+
+    Expects JSON: {"commands": ["user_input", ...]} with at most
+    MAX_BATCH_COMMANDS (16) entries
+    Returns JSON: {"results": [{"output": "...", "status": return_code}, ...]}
+    """
+    try:
+        data, error_response = parse_json_body()
+        if error_response is not None:
+            return error_response
+
+        commands = data.get('commands') if isinstance(data, dict) else None
+        if not isinstance(commands, list) or not all(
+                isinstance(command, str) for command in commands):
+            return ojsonify({
+                'output': 'Error: Expected a list of commands',
                 'status': 1
-            }), 408
+            }, 400)
 
-        except Exception as e:
-            return jsonify({
-                'output': f'Error executing command: {str(e)}',
+        if len(commands) > MAX_BATCH_COMMANDS:
+            return ojsonify({
+                'output':
+                f'Error: At most {MAX_BATCH_COMMANDS} commands per batch',
                 'status': 1
-            }), 500
+            }, 413)
+
+        # Answer builtins inline; only subprocesses go through the shared
+        # pool, so cheap commands never queue behind other callers
+        results = [None] * len(commands)
+        futures = {}
+        for index, command in enumerate(commands):
+            command = command.strip()
+            result, _, safe_args = resolve_user_command(
+                command, command.lower())
+            if safe_args is None:
+                results[index] = result
+            else:
+                futures[index] = _batch_executor.submit(
+                    _run_batch_system_command, safe_args)
+
+        # The whole batch shares one deadline; anything still queued or
+        # running behind other batches is reported as timed out
+        wait(futures.values(), timeout=COMMAND_TIMEOUT)
+        for index, future in futures.items():
+            if future.done():
+                results[index] = future.result()
+            else:
+                future.cancel()
+                results[index] = {
+                    'output':
+                    f'Error: Command timed out after {COMMAND_TIMEOUT} seconds',
+                    'status': 1
+                }
+        return ojsonify({'results': results})
 
     except Exception as e:
-        return jsonify({'output': f'Server error: {str(e)}', 'status': 1}), 500
+        return ojsonify({'output': f'Server error: {str(e)}', 'status': 1}, 500)
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return ojsonify({'error': 'Endpoint not found'}, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({'error': 'Internal server error'}), 500
+    return ojsonify({'error': 'Internal server error'}, 500)
 
 
 if __name__ == '__main__':
@@ -417,5 +897,7 @@ if __name__ == '__main__':
     os.makedirs('templates', exist_ok=True)
     os.makedirs('static', exist_ok=True)
 
-    # Run Flask development server
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # FLASK_DEBUG=1 enables the debugger and reloader. Requests are served
+    # on threads of this one process so the in-process caches stay warm;
+    # use wsgi.py with gunicorn for real deployments
+    app.run(host='0.0.0.0', port=5000, debug=app.debug, threaded=True)
@@ -0,0 +1,74 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import main
+
+SLOW_COMMAND = 'tail -f /proc/loadavg'
+
+
+def run_batch(client, commands):
+    return client.post('/run_commands', json={'commands': commands})
+
+
+def test_results_keep_request_order(client):
+    response = run_batch(client, ['pwd', 'echo second', 'ls', 'about', 'rm x'])
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['output'] for r in results[:2]] == [main._CWD, 'second']
+    assert 'main.py' in results[2]['output'].split()
+    assert results[3]['output'] == main.PORTFOLIO_OUTPUTS['about']
+    assert results[4]['status'] == 1
+    assert 'not allowed' in results[4]['output']
+
+
+def test_rejects_non_list_commands(client):
+    for body in ({'commands': 'ls'}, {'commands': ['ls', 5]}, {}, [1]):
+        response = client.post('/run_commands', json=body)
+        assert response.status_code == 400
+
+
+def test_rejects_invalid_json_and_content_type(client):
+    response = client.post('/run_commands',
+                           data='{bad',
+                           content_type='application/json')
+    assert response.status_code == 400
+
+    response = client.post('/run_commands',
+                           data='{"commands": ["pwd"]}',
+                           content_type='text/plain')
+    assert response.status_code == 415
+
+
+def test_rejects_oversized_batch(client):
+    assert run_batch(client, ['pwd'] * main.MAX_BATCH_COMMANDS).status_code == 200
+    response = run_batch(client, ['pwd'] * (main.MAX_BATCH_COMMANDS + 1))
+    assert response.status_code == 413
+
+
+def test_slow_command_reports_timeout(client, monkeypatch):
+    monkeypatch.setattr(main, 'COMMAND_TIMEOUT', 0.5)
+
+    results = run_batch(client, [SLOW_COMMAND, 'pwd']).get_json()['results']
+
+    assert results[0] == {
+        'output': 'Error: Command timed out after 0.5 seconds',
+        'status': 1
+    }
+    assert results[1] == {'output': main._CWD, 'status': 0}
+
+
+def test_builtins_do_not_wait_for_busy_pool(client, monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    pool.submit(release.wait)
+    monkeypatch.setattr(main, '_batch_executor', pool)
+    monkeypatch.setattr(main, 'COMMAND_TIMEOUT', 5)
+    try:
+        results = run_batch(client, ['pwd', 'whoami']).get_json()['results']
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert [r['status'] for r in results] == [0, 0]
+    assert results[0]['output'] == main._CWD
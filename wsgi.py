@@ -0,0 +1,10 @@
+"""
+Interactive Portfolio Terminal - WSGI entry point
+Serves the Flask app under a multi-process WSGI server:
+
+    gunicorn wsgi:app
+
+Worker, thread and keep-alive settings live in gunicorn.conf.py.
+"""
+
+from main import app